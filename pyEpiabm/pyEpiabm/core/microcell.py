@@ -2,6 +2,7 @@
 # Microcell Class
 #
 
+import math
 import typing
 from numbers import Number
 import logging
@@ -41,6 +42,9 @@ class Microcell:
         self.location = cell.location
         self.compartment_counter = _CompartmentCounter(
             f"Microcell {id(self)}")
+        # Intervention start times, infinite while not in place
+        self.closure_start_time = math.inf
+        self.distancing_start_time = math.inf
 
     def __repr__(self):
         """Returns a string representation of Microcell.
@@ -29,6 +29,92 @@ class Parameters:
                     if isinstance(value, list):
                         value = np.array(value)
                     setattr(self, key, value)
+            self._finalize()
+
+        @property
+        def intervention_params(self):
+            """Dictionary of intervention parameters. Setting this
+            re-derives the flat intervention fields with
+            :meth:`_finalize`.
+
+            """
+            return self._intervention_params
+
+        @intervention_params.setter
+        def intervention_params(self, value):
+            self._intervention_params = value
+            self._finalize()
+
+        @property
+        def carehome_params(self):
+            """Dictionary of carehome parameters. Setting or deleting this
+            re-derives the flat carehome scaling fields with
+            :meth:`_finalize`.
+
+            """
+            return self._carehome_params
+
+        @carehome_params.setter
+        def carehome_params(self, value):
+            self._carehome_params = value
+            self._finalize()
+
+        @carehome_params.deleter
+        def carehome_params(self):
+            del self._carehome_params
+            self._finalize()
+
+        def _finalize(self):
+            """Snapshot the intervention and carehome parameters used in
+            the force of infection into flat attributes, to avoid nested
+            dictionary lookups for each infector and infectee pair.
+            Parameters of interventions which are not configured are set to
+            1, as these interventions are never applied, and so are
+            carehome scalings which are not configured.
+
+            This is called whenever `intervention_params` or
+            `carehome_params` is set, and should be called again if either
+            is modified in place.
+
+            """
+            from pyEpiabm.property import PlaceType
+            ones = np.ones(len(PlaceType))
+            interventions = self.__dict__.get('_intervention_params', {})
+            pc = interventions.get('place_closure', {})
+            ci = interventions.get('case_isolation', {})
+            hq = interventions.get('household_quarantine', {})
+            sd = interventions.get('social_distancing', {})
+
+            self._closure_place_mask = Parameters.place_type_mask(
+                pc.get('closure_place_type', []))
+            self._closure_household_inf = float(
+                pc.get('closure_household_infectiousness', 1))
+            self._iso_house_eff = float(
+                ci.get('isolation_house_effectiveness', 1))
+            self._iso_eff = float(ci.get('isolation_effectiveness', 1))
+            self._quarantine_house_eff = float(
+                hq.get('quarantine_house_effectiveness', 1))
+            self._quarantine_place_eff = np.asarray(
+                hq.get('quarantine_place_effectiveness', ones),
+                dtype=np.float64)
+            self._dist_house_susc = float(
+                sd.get('distancing_house_susc', 1))
+            self._dist_house_enh_susc = float(
+                sd.get('distancing_house_enhanced_susc', 1))
+            self._dist_place_susc = np.asarray(
+                sd.get('distancing_place_susc', ones), dtype=np.float64)
+            self._dist_place_enh_susc = np.asarray(
+                sd.get('distancing_place_enhanced_susc', ones),
+                dtype=np.float64)
+
+            # Household scaling indexed by care_home_resident, and key
+            # worker scaling indexed by place type index
+            carehome = self.__dict__.get('_carehome_params', {})
+            self._carehome_household_scale = (1.0, float(
+                carehome.get('carehome_resident_household_scaling', 1)))
+            self._carehome_worker_scale = ones.copy()
+            self._carehome_worker_scale[PlaceType.CareHome.value - 1] = \
+                carehome.get('carehome_worker_group_scaling', 1)
 
     _instance = None  # Singleton instance
 
@@ -51,3 +137,20 @@ class Parameters:
     def set_file(file_path):
         """Loads file"""
         Parameters._instance = Parameters.__Parameters(file_path)
+
+    @staticmethod
+    def place_type_mask(place_types):
+        """Packs a list of place type values into a bitmask.
+
+        Parameters
+        ----------
+        place_types : list
+            Values of PlaceTypes to include
+
+        Returns
+        -------
+        int
+            Bitmask with bit `place_type.value` set for each place type
+
+        """
+        return sum(1 << int(value) for value in set(place_types))
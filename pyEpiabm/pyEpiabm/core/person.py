@@ -2,6 +2,8 @@
 # Person Class
 #
 
+import math
+import numbers
 import random
 
 from pyEpiabm.property import InfectionStatus
@@ -25,6 +27,11 @@ class Person:
         Person's next infection status after current one
     time_of_status_change: int
         Time when person's infection status is updated
+    isolation_start_time : float
+        Time person starts case isolation, or infinity if not isolating
+    quarantine_start_time : float
+        Time person starts household quarantine, or infinity if not in
+        quarantine
 
     """
 
@@ -52,6 +59,9 @@ class Person:
         self.infection_start_time = None
         self.care_home_resident = False
         self.key_worker = False
+        self.isolation_start_time = math.inf
+        self.quarantine_start_time = math.inf
+        self.distancing_enhanced = False
 
         self.set_random_age(age_group)
 
@@ -188,13 +198,17 @@ class Person:
 
         Parameters
         ----------
-        closure_place_type: a list of PlaceType
-            PlaceType should be closed if in place closure intervention
+        closure_place_type: int or list
+            Bitmask with bit `place_type.value` set for each PlaceType which
+            should be closed if in place closure intervention, or a list of
+            these PlaceType values
 
         """
-        if (hasattr(self.microcell, 'closure_start_time')) and (
-                self.microcell.closure_start_time is not None):
+        if self.microcell.closure_start_time != math.inf:
+            if not isinstance(closure_place_type, numbers.Integral):
+                closure_place_type = Parameters.place_type_mask(
+                    closure_place_type)
             for place_type in self.place_types:
-                if place_type.value in closure_place_type:
+                if (closure_place_type >> place_type.value) & 1:
                     return True
         return False
@@ -53,6 +53,20 @@ class Place:
                 isinstance(loc[1], Number)):
             raise ValueError("Location must be a tuple of float-type")
 
+    @property
+    def place_type(self):
+        """Categorises the place. Setting this also updates `_idx`, the
+        place type index (`place_type.value - 1`) used to look up place
+        type dependent parameters.
+
+        """
+        return self._place_type
+
+    @place_type.setter
+    def place_type(self, place_type):
+        self._place_type = place_type
+        self._idx = PlaceType(place_type).value - 1
+
     def __repr__(self):
         """Returns a string representation of Place.
 
@@ -2,6 +2,7 @@
 # Case isolation Class
 #
 
+import math
 import random
 
 from pyEpiabm.intervention import AbstractIntervention
@@ -33,12 +34,11 @@ class CaseIsolation(AbstractIntervention):
     def __call__(self, time):
         for cell in self._population.cells:
             for person in cell.persons:
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time is not None):
+                if person.isolation_start_time != math.inf:
                     if time > person.isolation_start_time + self.\
                               isolation_duration:
                         # Stop isolating people after their isolation period
-                        person.isolation_start_time = None
+                        person.isolation_start_time = math.inf
                 else:
                     if person.is_symptomatic():
                         r = random.random()
@@ -51,6 +51,4 @@ class CaseIsolation(AbstractIntervention):
     def turn_off(self):
         for cell in self._population.cells:
             for person in cell.persons:
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time is not None):
-                    person.isolation_start_time = None
+                person.isolation_start_time = math.inf
@@ -2,6 +2,7 @@
 # Household quarantine Class
 #
 
+import math
 import random
 
 from pyEpiabm.intervention import AbstractIntervention
@@ -38,19 +39,16 @@ class HouseholdQuarantine(AbstractIntervention):
     def __call__(self, time):
         for cell in self._population.cells:
             for person in cell.persons:
-                if (hasattr(person, 'quarantine_start_time')) and (
-                        person.quarantine_start_time is not None):
+                if person.quarantine_start_time != math.inf:
                     if time > person.quarantine_start_time + self.\
                               quarantine_duration:
                         # Stop quarantine after quarantine period
-                        person.quarantine_start_time = None
-                    if (hasattr(person, 'isolation_start_time')) and (
-                            person.isolation_start_time is not None):
+                        person.quarantine_start_time = math.inf
+                    if person.isolation_start_time != math.inf:
                         # Isolated individual should not quarantine
-                        person.quarantine_start_time = None
+                        person.quarantine_start_time = math.inf
 
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time == time):
+                if person.isolation_start_time == time:
                     # Require household of symptomatic/isolating individuals to
                     # quarantine with given household compliance and individual
                     # compliance. Only check when infector starts its isolation
@@ -59,10 +57,8 @@ class HouseholdQuarantine(AbstractIntervention):
                     r_house = random.random()
                     if r_house < self.quarantine_house_compliant:
                         for household_person in person.household.persons:
-                            if (not hasattr(household_person,
-                                'isolation_start_time')) or (
-                                    household_person.isolation_start_time
-                                    is None):
+                            if household_person.isolation_start_time == \
+                                    math.inf:
                                 # isolated individuals don't quarantine
                                 r_indiv = random.random()
                                 if r_indiv < \
@@ -74,6 +70,4 @@ class HouseholdQuarantine(AbstractIntervention):
     def turn_off(self):
         for cell in self._population.cells:
             for person in cell.persons:
-                if (hasattr(person, 'quarantine_start_time')) and (
-                        person.quarantine_start_time is not None):
-                    person.quarantine_start_time = None
+                person.quarantine_start_time = math.inf
@@ -2,6 +2,8 @@
 # Place closure Class
 #
 
+import math
+
 from pyEpiabm.intervention import AbstractIntervention
 
 
@@ -31,12 +33,11 @@ class PlaceClosure(AbstractIntervention):
     def __call__(self, time):
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'closure_start_time')) and (
-                        microcell.closure_start_time is not None):
+                if microcell.closure_start_time != math.inf:
                     if time > microcell.closure_start_time + self.\
                               closure_duration:
                         # Reopen places after their closure period
-                        microcell.closure_start_time = None
+                        microcell.closure_start_time = math.inf
                 else:
                     if (microcell.count_infectious() >= self.
                             case_microcell_threshold):
@@ -46,6 +47,4 @@ class PlaceClosure(AbstractIntervention):
     def turn_off(self):
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'closure_start_time')) and (
-                        microcell.closure_start_time is not None):
-                    microcell.closure_start_time = None
+                microcell.closure_start_time = math.inf
@@ -2,6 +2,7 @@
 # Social Distancing Intervention
 #
 
+import math
 import random
 
 from pyEpiabm.core import Parameters
@@ -39,12 +40,11 @@ class SocialDistancing(AbstractIntervention):
     def __call__(self, time):
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'distancing_start_time')) and (
-                        microcell.distancing_start_time is not None):
+                if microcell.distancing_start_time != math.inf:
                     if time > microcell.distancing_start_time + self.\
                               distancing_duration:
                         # Stop social distancing after their distancing period
-                        microcell.distancing_start_time = None
+                        microcell.distancing_start_time = math.inf
                 else:
                     if microcell.count_infectious() >= self.\
                                 case_microcell_threshold:
@@ -64,6 +64,4 @@ class SocialDistancing(AbstractIntervention):
     def turn_off(self):
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'distancing_start_time')) and (
-                        microcell.distancing_start_time is not None):
-                    microcell.distancing_start_time = None
+                microcell.distancing_start_time = math.inf
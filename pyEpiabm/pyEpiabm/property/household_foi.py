@@ -3,7 +3,6 @@
 #
 
 from pyEpiabm.core import Parameters
-import pyEpiabm.core
 
 from .personal_foi import PersonalInfection
 
@@ -13,76 +12,65 @@ class HouseholdInfection:
     parameters for the force of infection parameter, within households.
 
     """
-    @staticmethod
-    def household_inf(infector, time: float):
-        """Calculate the infectiousness of a person in a given
-        household. Does not include interventions such as isolation,
-        or whether individual is a carehome resident.
+    _params = None  # Cached Parameters singleton
 
-        Parameters
-        ----------
-        infector : Person
-            Infector
-        time : float
-            Current simulation time
+    @classmethod
+    def _p(cls):
+        """Returns the :class:`Parameters` singleton, kept on the class.
+        The stored reference is compared with `Parameters._instance` on
+        every call, so that it is refreshed if a new parameter file has
+        been loaded. This costs about the same as calling
+        :meth:`Parameters.instance` directly.
 
         Returns
         -------
-        float
-            Infectiousness parameter of household
+        __Parameters
+            The current instance of the __Parameters class
 
         """
-        closure_inf = Parameters.instance().\
-            intervention_params['place_closure'][
-                'closure_household_infectiousness'] \
-            if (hasattr(infector.microcell, 'closure_start_time')) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                            infector.microcell.closure_start_time <= time
-                        ) else 1
-        household_infectiousness = PersonalInfection.person_inf(
-            infector, time) * closure_inf
-        return household_infectiousness
-
-    @staticmethod
-    def household_susc(infector, infectee, time: float):
-        """Calculate the susceptibility of one person to another in a given
-        household. Does not include interventions such as isolation,
-        or whether individual is a carehome resident.
+        if cls._params is not Parameters._instance:
+            cls._params = Parameters.instance()
+        return cls._params
+
+    @classmethod
+    def household_foi_inf(cls, infector, time: float):
+        """Calculate the part of the force of infection parameter of a
+        household which depends only on the infector. This includes
+        interventions such as isolation, and whether the infector is a
+        carehome resident, so may be computed once per infector and
+        passed to :meth:`household_foi` for each of their infectees.
 
         Parameters
         ----------
         infector : Person
             Infector
-        infectee : Person
-            Infectee
         time : float
             Current simulation time
 
         Returns
         -------
         float
-            Susceptibility parameter of household
+            Infectiousness component of the household force of infection
 
         """
-        household_susceptibility = PersonalInfection.person_susc(
-            infector, infectee, time)
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
-                    infector.microcell.distancing_start_time <= time):
-            if infector.distancing_enhanced is True:
-                household_susceptibility *= Parameters.instance().\
-                    intervention_params['social_distancing'][
-                        'distancing_house_enhanced_susc']
-            else:
-                household_susceptibility *= Parameters.instance().\
-                    intervention_params['social_distancing'][
-                        'distancing_house_susc']
-        return household_susceptibility
-
-    @staticmethod
-    def household_foi(infector, infectee, time: float):
+        params = cls._p()
+        infectiousness = PersonalInfection.person_inf(infector, time)
+        if infector.microcell.closure_start_time <= time and \
+                infector.is_place_closed(params._closure_place_mask):
+            infectiousness *= params._closure_household_inf
+        seasonality = 1.0  # Not yet implemented
+        infectiousness *= seasonality * params.household_transmission
+        infectiousness *= params._carehome_household_scale[
+            infector.care_home_resident]
+        if infector.isolation_start_time <= time:
+            infectiousness *= params._iso_house_eff
+        if infector.quarantine_start_time <= time:
+            infectiousness *= params._quarantine_house_eff
+        return infectiousness
+
+    @classmethod
+    def household_foi(cls, infector, infectee, time: float,
+                      precomputed_inf: float = None):
         """Calculate the force of infection parameter of a household,
         for a particular infector and infectee.
 
@@ -94,6 +82,9 @@ class HouseholdInfection:
             Infectee
         time : float
             Current simulation time
+        precomputed_inf : float
+            Output of :meth:`household_foi_inf` for this infector and time,
+            which is calculated if not given
 
         Returns
         -------
@@ -101,34 +92,19 @@ class HouseholdInfection:
             Force of infection parameter of household
 
         """
-        carehome_scale_inf = 1
-        if infector.care_home_resident:
-            carehome_scale_inf = Parameters.instance()\
-                .carehome_params["carehome_resident_household_scaling"]
-        carehome_scale_susc = 1
-        if infectee.care_home_resident:
-            carehome_scale_susc = Parameters.instance()\
-                .carehome_params["carehome_resident_household_scaling"]
-        seasonality = 1.0  # Not yet implemented
-        isolating = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_house'
-                                                  '_effectiveness'] \
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
-        quarantine = Parameters.instance().\
-            intervention_params['household_quarantine']['quarantine_house'
-                                                        '_effectiveness'] \
-            if (hasattr(infector, 'quarantine_start_time')) and (
-                infector.quarantine_start_time is not None) and (
-                    infector.quarantine_start_time <= time) else 1
-        infectiousness = (HouseholdInfection.household_inf(infector, time)
-                          * seasonality
-                          * pyEpiabm.core.Parameters.instance().
-                          household_transmission
-                          * carehome_scale_inf
-                          * isolating * quarantine)
-        susceptibility = (HouseholdInfection.household_susc(infector,
-                                                            infectee, time)
-                          * carehome_scale_susc)
+        params = cls._p()
+        if precomputed_inf is None:
+            infectiousness = cls.household_foi_inf(infector, time)
+        else:
+            infectiousness = precomputed_inf
+
+        susceptibility = PersonalInfection.person_susc(
+            infector, infectee, time)
+        if infector.microcell.distancing_start_time <= time:
+            if infector.distancing_enhanced is True:
+                susceptibility *= params._dist_house_enh_susc
+            else:
+                susceptibility *= params._dist_house_susc
+        susceptibility *= params._carehome_household_scale[
+            infectee.care_home_resident]
         return (infectiousness * susceptibility)
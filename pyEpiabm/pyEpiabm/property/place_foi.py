@@ -12,8 +12,28 @@ class PlaceInfection:
     parameters for the force of infection parameter, within places.
     """
 
-    @staticmethod
-    def place_inf(place, infector, time: float):
+    _params = None  # Cached Parameters singleton
+
+    @classmethod
+    def _p(cls):
+        """Returns the :class:`Parameters` singleton, kept on the class.
+        The stored reference is compared with `Parameters._instance` on
+        every call, so that it is refreshed if a new parameter file has
+        been loaded. This costs about the same as calling
+        :meth:`Parameters.instance` directly.
+
+        Returns
+        -------
+        __Parameters
+            The current instance of the __Parameters class
+
+        """
+        if cls._params is not Parameters._instance:
+            cls._params = Parameters.instance()
+        return cls._params
+
+    @classmethod
+    def place_inf(cls, place, infector, time: float):
         """Calculate the infectiousness of a place. Does not include
         interventions such as isolation, or whether individual is a
         carehome resident.
@@ -36,68 +56,25 @@ class PlaceInfection:
             Infectiousness parameter of place
 
         """
-        params = Parameters.instance().place_params
-        transmission = params["place_transmission"]
-        place_idx = place.place_type.value - 1
+        params = cls._p()
+        place_params = params.place_params
+        transmission = place_params["place_transmission"]
+        place_idx = place._idx
         try:
-            num_groups = params["mean_group_size"][place_idx]
+            num_groups = place_params["mean_group_size"][place_idx]
         except IndexError:  # For place types not in parameters
             num_groups = 1
+        if infector.microcell.closure_start_time <= time:
+            if infector.is_place_closed(params._closure_place_mask):
+                return 0
         # Use group-wise capacity not max_capacity once implemented
-        place_inf = 0 if ((hasattr(infector.microcell, 'closure_start_time'))
-                          ) and (infector.is_place_closed(
-                            Parameters.instance().intervention_params[
-                                'place_closure']['closure_place_type'])) and (
-                                infector.microcell.closure_start_time <= time
-                                ) else \
-            (transmission / num_groups
-                * PersonalInfection.person_inf(infector, time))
+        place_inf = (transmission / num_groups
+                     * PersonalInfection.person_inf(infector, time))
         return place_inf
 
-    @staticmethod
-    def place_susc(place, infector, infectee,
-                   time: float):
-        """Calculate the susceptibility of a place.
-        Does not include interventions such as isolation,
-        or whether individual is a carehome resident.
-
-        Parameters
-        ----------
-        infector : Person
-            Infector
-        infectee : Person
-            Infectee
-        place : Place
-            Place
-        time : float
-            Current simulation time
-
-        Returns
-        -------
-        float
-            Susceptibility parameter of place
-
-        """
-        place_susc = 1.0
-        place_idx = place.place_type.value - 1
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
-                    infector.microcell.distancing_start_time <= time):
-            if infector.distancing_enhanced is True:
-                place_susc *= Parameters.instance().\
-                             intervention_params[
-                             'social_distancing'][
-                             'distancing_place_enhanced_susc'][place_idx]
-            else:
-                place_susc *= Parameters.instance().\
-                             intervention_params[
-                             'social_distancing'][
-                             'distancing_place_susc'][place_idx]
-        return place_susc
-
-    @staticmethod
-    def place_foi(place, infector, infectee,
-                  time: float):
+    @classmethod
+    def place_foi(cls, place, infector, infectee,
+                  time: float, precomputed_inf: float = None):
         """Calculate the force of infection of a place, for a particular
         infector and infectee.
 
@@ -111,6 +88,9 @@ class PlaceInfection:
             Place
         time : float
             Current simulation time
+        precomputed_inf : float
+            Output of :meth:`place_inf` for this place, infector and time,
+            which is calculated if not given
 
         Returns
         -------
@@ -118,25 +98,27 @@ class PlaceInfection:
             Force of infection parameter of place
 
         """
-        carehome_scale_susc = 1
-        if place.place_type.value == 5 and (infectee.key_worker
-                                            or infector.key_worker):
-            carehome_scale_susc = Parameters.instance()\
-                .carehome_params["carehome_worker_group_scaling"]
-        isolating = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
-        place_idx = place.place_type.value - 1
-        quarantine = Parameters.instance().\
-            intervention_params['household_quarantine'][
-                'quarantine_place_effectiveness'][place_idx]\
-            if (hasattr(infector, 'quarantine_start_time')) and (
-                infector.quarantine_start_time is not None) and (
-                    infector.quarantine_start_time <= time) else 1
-        infectiousness = (PlaceInfection.place_inf(place, infector, time)
-                          * isolating * quarantine)
-        susceptibility = (PlaceInfection.place_susc(place, infector, infectee,
-                          time) * carehome_scale_susc * quarantine)
+        params = cls._p()
+        place_idx = place._idx
+        if precomputed_inf is None:
+            infectiousness = cls.place_inf(place, infector, time)
+        else:
+            infectiousness = precomputed_inf
+        if infector.isolation_start_time <= time:
+            infectiousness *= params._iso_eff
+
+        susceptibility = 1.0
+        if infector.microcell.distancing_start_time <= time:
+            if infector.distancing_enhanced is True:
+                susceptibility *= params._dist_place_enh_susc[place_idx]
+            else:
+                susceptibility *= params._dist_place_susc[place_idx]
+        if infectee.key_worker or infector.key_worker:
+            susceptibility *= params._carehome_worker_scale[place_idx]
+
+        # Quarantine scales both infectiousness and susceptibility
+        if infector.quarantine_start_time <= time:
+            quarantine = params._quarantine_place_eff[place_idx]
+            infectiousness *= quarantine
+            susceptibility *= quarantine
         return (infectiousness * susceptibility)
@@ -65,11 +65,9 @@ class SpatialInfection:
             if pyEpiabm.core.Parameters.instance().use_ages is True else 1
         closure_spatial = Parameters.instance().\
             intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
+            if (infector.microcell.closure_start_time <= time) and (
                 infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
+                    Parameters.instance()._closure_place_mask)) else 1
         return infector.infectiousness * age * closure_spatial
 
     @staticmethod
@@ -102,15 +100,11 @@ class SpatialInfection:
 
         spatial_susc *= Parameters.instance().\
             intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
+            if (infector.microcell.closure_start_time <= time) and (
                 infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
+                    Parameters.instance()._closure_place_mask)) else 1
 
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
-                    infector.microcell.distancing_start_time <= time):
+        if infector.microcell.distancing_start_time <= time:
             if infector.distancing_enhanced is True:
                 spatial_susc *= Parameters.instance().\
                     intervention_params['social_distancing'][
@@ -157,15 +151,11 @@ class SpatialInfection:
 
         isolating = Parameters.instance().\
             intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
+            if infector.isolation_start_time <= time else 1
         quarantine = Parameters.instance().\
             intervention_params['household_quarantine'][
                 'quarantine_spatial_effectiveness']\
-            if (hasattr(infector, 'quarantine_start_time')) and (
-                infector.quarantine_start_time is not None) and (
-                    infector.quarantine_start_time <= time) else 1
+            if infector.quarantine_start_time <= time else 1
         infectiousness = (SpatialInfection.spatial_inf(
             inf_cell, infector, time) * carehome_scale_inf
             * isolating * quarantine)
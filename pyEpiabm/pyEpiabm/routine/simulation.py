@@ -81,6 +81,8 @@ class Simulation:
             if "age_stratified" in file_params else False
 
         Parameters.instance().use_ages = self.age_stratified
+        # Re-derive intervention fields in case they were modified in place
+        Parameters.instance()._finalize()
 
         # If random seed is specified in parameters, set this in numpy
         if "simulation_seed" in self.sim_params:
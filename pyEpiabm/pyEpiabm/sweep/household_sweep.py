@@ -39,13 +39,22 @@ class HouseholdSweep(AbstractSweep):
                     raise AttributeError(f"{infector} is not part of a "
                                          + "household")
 
+                if not infector.household.susceptible_persons:
+                    continue
+
+                # The infector's contribution to the force of infection is
+                # the same for each of their household members.
+                infectiousness = HouseholdInfection.household_foi_inf(
+                    infector, time)
+
                 # Loop over susceptible household members.
                 for infectee in infector.household.susceptible_persons:
 
                     # Calculate "force of infection" parameter which will
                     # determine the likelihood of an infection event.
                     force_of_infection = HouseholdInfection.household_foi(
-                        infector, infectee, time)
+                        infector, infectee, time,
+                        precomputed_inf=infectiousness)
 
                     # Compare a uniform random number to the force of infection
                     # to see whether an infection event occurs in this timestep
@@ -81,7 +81,8 @@ class PlaceSweep(AbstractSweep):
 
                             force_of_infection = PlaceInfection.\
                                 place_foi(place, infector, infectee,
-                                          time)
+                                          time,
+                                          precomputed_inf=infectiousness)
 
                             # Compare a uniform random number to the force of
                             # infection to see whether an infection event
@@ -2,7 +2,9 @@
 # Help to run functionl tests for interventions.
 #
 
+import copy
 import unittest
+import numpy as np
 
 import pyEpiabm as pe
 from pyEpiabm.property.infection_status import InfectionStatus
@@ -31,41 +33,58 @@ class HelperFunc(unittest.TestCase):
             Specify if the comparing is for greater or equal or only equal
 
         """
+        # Retrieve each cell's counts once, for use in all comparisons
+        small = [np.asarray(cell.compartment_counter.retrieve()[status])
+                 for cell in small_pop[:2]]
+        large = [np.asarray(cell.compartment_counter.retrieve()[status])
+                 for cell in large_pop[:2]]
+
+        # Compare all age groups at once, and only check each age group
+        # separately to report which failed
+        if method == 'greater':
+            if all(np.all(b >= a) for a, b in zip(small, large)):
+                return
+        elif method == 'equal':
+            if all(np.array_equal(a, b) for a, b in zip(small, large)):
+                return
+
         for age_group in range(len(pe.Parameters.instance().age_proportions)):
             with self.subTest(age_group=age_group):
-                if method == 'greater':
-                    self.assertGreaterEqual(
-                        large_pop[0].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[0].compartment_counter.retrieve()[
-                            status][age_group])
-                    self.assertGreaterEqual(
-                        large_pop[1].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[1].compartment_counter.retrieve()[
-                            status][age_group])
-                elif method == 'equal':
-                    self.assertEqual(
-                        large_pop[0].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[0].compartment_counter.retrieve()[
-                            status][age_group])
-                    self.assertEqual(
-                        large_pop[1].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[1].compartment_counter.retrieve()[
-                            status][age_group])
+                for small_counts, large_counts in zip(small, large):
+                    if method == 'greater':
+                        self.assertGreaterEqual(large_counts[age_group],
+                                                small_counts[age_group])
+                    elif method == 'equal':
+                        self.assertEqual(large_counts[age_group],
+                                         small_counts[age_group])
+
+    _sweeps = None  # Sweep list built for the parameters below
+    _sweep_params = None
+    _sweep_interventions = None
 
     @classmethod
     def sweep_list_initialise(cls):
         """Initialise and return a sweep list for simulation.
+
+        The sweeps are only constructed again when the parameters or the
+        intervention parameters are replaced. Otherwise a deep copy is
+        returned, so each simulation binds its own population, while
+        the current intervention parameters are shared rather than copied.
         """
-        return [
-            pe.sweep.InterventionSweep(),
-            pe.sweep.UpdatePlaceSweep(),
-            pe.sweep.HouseholdSweep(),
-            pe.sweep.PlaceSweep(),
-            pe.sweep.SpatialSweep(),
-            pe.sweep.QueueSweep(),
-            pe.sweep.HostProgressionSweep(),
-        ]
+        params = pe.Parameters.instance()
+        interventions = params.intervention_params
+        if (cls._sweeps is None or cls._sweep_params is not params
+                or cls._sweep_interventions is not interventions):
+            cls._sweeps = [
+                pe.sweep.InterventionSweep(),
+                pe.sweep.UpdatePlaceSweep(),
+                pe.sweep.HouseholdSweep(),
+                pe.sweep.PlaceSweep(),
+                pe.sweep.SpatialSweep(),
+                pe.sweep.QueueSweep(),
+                pe.sweep.HostProgressionSweep(),
+            ]
+            cls._sweep_params = params
+            cls._sweep_interventions = interventions
+        return copy.deepcopy(cls._sweeps,
+                             {id(interventions): interventions})
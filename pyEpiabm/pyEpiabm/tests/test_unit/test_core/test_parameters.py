@@ -2,8 +2,10 @@ from collections import defaultdict
 import unittest
 from unittest.mock import patch
 import os
+import numpy as np
 
 import pyEpiabm as pe
+from pyEpiabm.property import PlaceType
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
 
 
@@ -27,6 +29,56 @@ class TestParameters(TestPyEpiabm):
         my_dict = defaultdict(int, my_dict)
         self.assertEqual(my_dict["false_key"], 0)
 
+    def test_finalize(self):
+        params = pe.Parameters.instance()
+        interventions = params.intervention_params
+        self.assertEqual(params._closure_place_mask, sum(
+            1 << place_type for place_type
+            in interventions['place_closure']['closure_place_type']))
+        self.assertEqual(params._iso_house_eff, interventions[
+            'case_isolation']['isolation_house_effectiveness'])
+        np.testing.assert_array_equal(
+            params._dist_place_susc,
+            interventions['social_distancing']['distancing_place_susc'])
+
+        isolation = interventions['case_isolation']
+        effectiveness = isolation['isolation_effectiveness']
+        isolation['isolation_effectiveness'] = 0.1
+        self.assertNotEqual(params._iso_eff, 0.1)
+        params._finalize()
+        self.assertEqual(params._iso_eff, 0.1)
+        isolation['isolation_effectiveness'] = effectiveness
+        params._finalize()
+
+    def test_finalize_on_set(self):
+        params = pe.Parameters.instance()
+        interventions = params.intervention_params
+        params.intervention_params = {}
+        self.assertEqual(params._closure_place_mask, 0)
+        self.assertEqual(params._quarantine_house_eff, 1)
+        np.testing.assert_array_equal(params._quarantine_place_eff,
+                                      np.ones(len(PlaceType)))
+        params.intervention_params = interventions
+        self.assertEqual(params._quarantine_house_eff, interventions[
+            'household_quarantine']['quarantine_house_effectiveness'])
+
+    def test_finalize_carehome_on_set(self):
+        params = pe.Parameters.instance()
+        carehome = params.carehome_params
+        params.carehome_params = {
+            'carehome_resident_household_scaling': 3,
+            'carehome_worker_group_scaling': 4}
+        self.assertEqual(params._carehome_household_scale, (1.0, 3.0))
+        self.assertEqual(params._carehome_worker_scale[
+            PlaceType.CareHome.value - 1], 4)
+        self.assertEqual(params._carehome_worker_scale[
+            PlaceType.Workplace.value - 1], 1)
+        del params.carehome_params
+        self.assertEqual(params._carehome_household_scale, (1.0, 1.0))
+        np.testing.assert_array_equal(params._carehome_worker_scale,
+                                      np.ones(len(PlaceType)))
+        params.carehome_params = carehome
+
 
 class TestNoConfigParameters(unittest.TestCase):
     """Test class for tests without implicit config call
@@ -75,6 +127,12 @@ class TestNoConfigParameters(unittest.TestCase):
         mock_load.assert_called_once()
         self.assertListEqual(list(pe.Parameters.instance().list1), list_val)
 
+    def test_place_type_mask(self):
+        self.assertEqual(pe.Parameters.place_type_mask([]), 0)
+        self.assertEqual(pe.Parameters.place_type_mask([1, 3, 3]), 0b1010)
+        self.assertEqual(pe.Parameters.place_type_mask(
+            [PlaceType.CareHome.value]), 1 << 5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,6 @@
+import math
 import unittest
+import numpy as np
 from unittest.mock import patch, MagicMock
 
 import pyEpiabm as pe
@@ -95,7 +97,7 @@ class TestPerson(TestPyEpiabm):
         closure_place_type = pe.Parameters.instance().intervention_params[
             'place_closure']['closure_place_type']
         # Not in place closure
-        self.assertFalse(hasattr(self.person.microcell, 'closure_start_time'))
+        self.assertEqual(self.person.microcell.closure_start_time, math.inf)
         self.assertFalse(self.person.is_place_closed(closure_place_type))
         # Place closure time starts but the place is not in closure_place_type
         self.person.microcell.closure_start_time = 1
@@ -104,6 +106,12 @@ class TestPerson(TestPyEpiabm):
         # Place closure time starts and the place is in closure_place_type
         self.person.place_types.append(pe.property.PlaceType.PrimarySchool)
         self.assertTrue(self.person.is_place_closed(closure_place_type))
+        # Closure place types given as a bitmask
+        closure_mask = pe.Parameters.instance()._closure_place_mask
+        self.assertTrue(self.person.is_place_closed(closure_mask))
+        self.assertTrue(self.person.is_place_closed(np.int64(closure_mask)))
+        self.assertFalse(self.person.is_place_closed(
+            1 << pe.property.PlaceType.CareHome.value))
 
 
 if __name__ == '__main__':
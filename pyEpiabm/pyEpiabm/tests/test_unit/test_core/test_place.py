@@ -27,6 +27,7 @@ class TestPlace(TestPyEpiabm):
         self.assertEqual(test_place._location, (1.0, 1.0))
         self.assertEqual(test_place.persons, [])
         self.assertEqual(test_place.place_type, PlaceType.Workplace)
+        self.assertEqual(test_place._idx, PlaceType.Workplace.value - 1)
         self.assertDictEqual(test_place.person_groups, {0: []})
         self.assertEqual(test_place.susceptibility, 0)
         self.assertEqual(test_place.infectiousness, 0)
@@ -37,6 +38,14 @@ class TestPlace(TestPyEpiabm):
 
         self.assertEqual(len(test_place.persons), 0)
 
+    def test_place_type(self):
+        test_place = pe.Place((1.0, 1.0), PlaceType.Workplace,
+                              self.cell, self.microcell)
+        test_place.place_type = PlaceType.CareHome
+        self.assertEqual(test_place.place_type, PlaceType.CareHome)
+        self.assertEqual(test_place._idx, 4)
+        self.assertRaises(ValueError, setattr, test_place, 'place_type', 0)
+
     def test_repr(self):
         test_place = pe.Place((1.0, 1.0), PlaceType.Workplace,
                               self.cell, self.microcell)
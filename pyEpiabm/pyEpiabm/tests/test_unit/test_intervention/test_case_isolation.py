@@ -1,3 +1,4 @@
+import math
 import unittest
 
 import pyEpiabm as pe
@@ -45,19 +46,19 @@ class TestCaseIsolation(TestPyEpiabm):
 
     def test___call__(self):
         # Before isolation starts
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
-        self.assertFalse(hasattr(self.person_symp, 'isolation_start_time'))
+        self.assertEqual(self.person_susc.isolation_start_time, math.inf)
+        self.assertEqual(self.person_symp.isolation_start_time, math.inf)
 
         # Start isolation if the person is symptomatic
         self.caseisolation.isolation_probability = 1.0
         self.caseisolation(time=5)
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
+        self.assertEqual(self.person_susc.isolation_start_time, math.inf)
         self.assertEqual(self.person_symp.isolation_start_time, 5)
 
         # End isolation
         self.caseisolation(time=150)
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
-        self.assertIsNone(self.person_symp.isolation_start_time)
+        self.assertEqual(self.person_susc.isolation_start_time, math.inf)
+        self.assertEqual(self.person_symp.isolation_start_time, math.inf)
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import math
 import unittest
 
 import pyEpiabm as pe
@@ -61,27 +62,27 @@ class TestHouseholdQuarantine(TestPyEpiabm):
         self.householdquarantine.quarantine_individual_compliant = 1.0
         self.sympt_person.isolation_start_time = 3
         self.householdquarantine(time=3)
-        self.assertFalse(hasattr(self.sympt_person, 'quarantine_start_time'))
+        self.assertEqual(self.sympt_person.quarantine_start_time, math.inf)
         self.assertEqual(self.susc_person1.quarantine_start_time, 4)
         self.assertEqual(self.susc_person2.quarantine_start_time, 4)
 
         # second household infection while in quarantine
         self.susc_person2.isolation_start_time = 6
         self.householdquarantine(time=6)
-        self.assertFalse(hasattr(self.sympt_person, 'quarantine_start_time'))
-        self.assertIsNone(self.susc_person2.quarantine_start_time)
+        self.assertEqual(self.sympt_person.quarantine_start_time, math.inf)
+        self.assertEqual(self.susc_person2.quarantine_start_time, math.inf)
         self.assertEqual(self.susc_person1.quarantine_start_time, 7)
 
         # End quarantine
         self.householdquarantine(time=22)
-        self.assertIsNone(self.susc_person1.quarantine_start_time)
+        self.assertEqual(self.susc_person1.quarantine_start_time, math.inf)
 
     def test_turn_off(self):
         self.susc_person1.quarantine_start_time = 370
         self.householdquarantine(time=370)
 
         self.householdquarantine.turn_off()
-        self.assertIsNone(self.susc_person1.quarantine_start_time)
+        self.assertEqual(self.susc_person1.quarantine_start_time, math.inf)
 
 
 if __name__ == '__main__':
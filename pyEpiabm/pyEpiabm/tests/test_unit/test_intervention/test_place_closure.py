@@ -1,3 +1,4 @@
+import math
 import unittest
 
 import pyEpiabm as pe
@@ -45,18 +46,18 @@ class TestPlaceClosure(TestPyEpiabm):
                          self.params['case_microcell_threshold'])
 
     def test___call__(self):
-        self.assertFalse(hasattr(self._microcell, 'closure_start_time'))
+        self.assertEqual(self._microcell.closure_start_time, math.inf)
         self.placeclosure(time=5)
-        self.assertIsNotNone(self._microcell.closure_start_time)
+        self.assertNotEqual(self._microcell.closure_start_time, math.inf)
         self.placeclosure(time=150)
-        self.assertIsNone(self._microcell.closure_start_time)
+        self.assertEqual(self._microcell.closure_start_time, math.inf)
 
     def test_turn_off(self):
         self._microcell.closure_start_time = 370
         self.placeclosure(time=370)
 
         self.placeclosure.turn_off()
-        self.assertIsNone(self._microcell.closure_start_time)
+        self.assertEqual(self._microcell.closure_start_time, math.inf)
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import math
 import unittest
 from unittest.mock import patch
 
@@ -51,24 +52,24 @@ class TestSocialDistancing(TestPyEpiabm):
 
     def test___call__(self):
         # Social distancing haven't start
-        self.assertFalse(hasattr(self.microcell, 'distancing_start_time'))
+        self.assertEqual(self.microcell.distancing_start_time, math.inf)
         # Age group exists with normal social distancing
         self.person.age_group = 0
         self.socialdistancing(time=5)
-        self.assertTrue(hasattr(self.microcell, 'distancing_start_time'))
+        self.assertNotEqual(self.microcell.distancing_start_time, math.inf)
         self.assertFalse(self.person.distancing_enhanced)
         # Social distancing ends
         self.socialdistancing(time=150)
-        self.assertIsNone(self.microcell.distancing_start_time)
+        self.assertEqual(self.microcell.distancing_start_time, math.inf)
         # Age group exists with enhanced social distancing
         self.person.age_group = 1
         self.socialdistancing(time=5)
-        self.assertIsNotNone(self.microcell.distancing_start_time)
+        self.assertNotEqual(self.microcell.distancing_start_time, math.inf)
         self.assertTrue(self.person.distancing_enhanced)
 
     @patch('pyEpiabm.core.Parameters.instance')
     def test___call__no_age(self, mock_params):
-        self.microcell.distancing_start_time = None
+        self.microcell.distancing_start_time = math.inf
         # Age group not exists
         mock_params.return_value.use_ages = False
         self.socialdistancing(time=5)
@@ -77,7 +78,7 @@ class TestSocialDistancing(TestPyEpiabm):
     def test_turn_off(self):
         self.microcell.distancing_start_time = 370
         self.socialdistancing.turn_off()
-        self.assertIsNone(self.microcell.distancing_start_time)
+        self.assertEqual(self.microcell.distancing_start_time, math.inf)
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 
 import pyEpiabm as pe
 from pyEpiabm.property import HouseholdInfection, PlaceType
@@ -28,17 +28,18 @@ class TestHouseholdInfection(TestPyEpiabm):
         self.infector = self._population.cells[0].microcells[0].persons[0]
         self.infectee = self._population.cells[0].microcells[0].persons[1]
 
-    def test_house_inf(self):
-        result = HouseholdInfection.household_inf(self.infector, self.time)
-        self.assertEqual(result, 1)
-        self.assertIsInstance(result, float)
+    def test_cached_parameters(self):
+        params = pe.Parameters.instance()
+        self.assertIs(HouseholdInfection._p(), params)
+        self.assertIs(HouseholdInfection._params, params)
 
-    def test_house_susc(self):
-        result = HouseholdInfection.household_susc(self.infector,
-                                                   self.infectee,
-                                                   self.time)
-        self.assertEqual(result, 1.0)
-        self.assertIsInstance(result, float)
+        # Cache is refreshed when a new parameter file is loaded
+        new_params = Mock()
+        pe.Parameters._instance = new_params
+        self.assertIs(HouseholdInfection._p(), new_params)
+        pe.Parameters._instance = None
+        self.assertRaises(RuntimeError, HouseholdInfection._p)
+        pe.Parameters._instance = params
 
     def test_house_inf_force(self):
         result = HouseholdInfection.household_foi(
@@ -46,8 +47,23 @@ class TestHouseholdInfection(TestPyEpiabm):
         self.assertEqual(result, 0.1)
         self.assertIsInstance(result, float)
 
+    def test_house_foi_precomputed(self):
+        self.infector.isolation_start_time = 1
+        infectiousness = HouseholdInfection.household_foi_inf(
+            self.infector, self.time)
+        self.assertAlmostEqual(infectiousness, 0.05)
+        result = HouseholdInfection.household_foi(
+            self.infector, self.infectee, self.time)
+        with patch('pyEpiabm.property.HouseholdInfection.household_foi_inf') \
+                as mock_inf:
+            result_precomputed = HouseholdInfection.household_foi(
+                self.infector, self.infectee, self.time,
+                precomputed_inf=infectiousness)
+            mock_inf.assert_not_called()
+        self.assertEqual(result, result_precomputed)
+
     def test_house_case_isolation(self):
-        # Not isolating (isolation_start_time = None)
+        # Not isolating (isolation_start_time = inf)
         result = HouseholdInfection.household_foi(
             self.infector, self.infectee, self.time)
 
@@ -63,9 +79,9 @@ class TestHouseholdInfection(TestPyEpiabm):
                          result_isolating)
 
     def test_house_place_closure(self):
-        # Update place type, no place closure (closure_start_time = None)
+        # Update place type, no place closure (closure_start_time = inf)
         self.infector.place_types.append(PlaceType.PrimarySchool)
-        result = HouseholdInfection.household_inf(
+        result = HouseholdInfection.household_foi_inf(
             self.infector, self.time)
 
         # Place closure
@@ -73,13 +89,13 @@ class TestHouseholdInfection(TestPyEpiabm):
             pe.Parameters.instance().intervention_params[
                 'place_closure']['closure_household_infectiousness']
         self.infector.microcell.closure_start_time = 1
-        result_closure = HouseholdInfection.household_inf(
+        result_closure = HouseholdInfection.household_foi_inf(
             self.infector, self.time)
-        self.assertEqual(result*closure_household_infectiousness,
-                         result_closure)
+        self.assertAlmostEqual(result*closure_household_infectiousness,
+                               result_closure)
 
     def test_house_household_quarantine(self):
-        # Not in quarantine (quarantine_start_time = None)
+        # Not in quarantine (quarantine_start_time = inf)
         result = HouseholdInfection.household_foi(
             self.infector, self.infectee, self.time)
 
@@ -95,8 +111,8 @@ class TestHouseholdInfection(TestPyEpiabm):
                          result_isolating)
 
     def test_house_social_distancing(self):
-        # Not in social distancing (distancing_start_time = None)
-        result = HouseholdInfection.household_susc(
+        # Not in social distancing (distancing_start_time = inf)
+        result = HouseholdInfection.household_foi(
             self.infector, self.infectee, self.time)
 
         # Normal social distancing
@@ -105,29 +121,28 @@ class TestHouseholdInfection(TestPyEpiabm):
         distancing_house_susc = pe.Parameters.instance().\
             intervention_params['social_distancing'][
                 'distancing_house_susc']
-        result_distancing = HouseholdInfection.household_susc(
+        result_distancing = HouseholdInfection.household_foi(
             self.infector, self.infectee, self.time)
-        self.assertEqual(result*distancing_house_susc,
-                         result_distancing)
+        self.assertAlmostEqual(result*distancing_house_susc,
+                               result_distancing)
 
         # Enhanced social distancing
         self.infector.distancing_enhanced = True
         distancing_house_enhanced_susc = pe.Parameters.instance().\
             intervention_params['social_distancing'][
                 'distancing_house_enhanced_susc']
-        result_distancing_enhanced = HouseholdInfection.household_susc(
+        result_distancing_enhanced = HouseholdInfection.household_foi(
             self.infector, self.infectee, self.time)
-        self.assertEqual(result*distancing_house_enhanced_susc,
-                         result_distancing_enhanced)
+        self.assertAlmostEqual(result*distancing_house_enhanced_susc,
+                               result_distancing_enhanced)
 
-    @patch('pyEpiabm.property.HouseholdInfection.household_susc')
-    @patch('pyEpiabm.property.HouseholdInfection.household_inf')
-    @patch('pyEpiabm.core.Parameters.instance')
+    @patch('pyEpiabm.property.PersonalInfection.person_susc')
+    @patch('pyEpiabm.property.PersonalInfection.person_inf')
+    @patch('pyEpiabm.property.HouseholdInfection._p')
     def test_carehome_scaling(self, mock_params, mock_inf, mock_susc):
         mock_inf.return_value = 1
         mock_susc.return_value = 1
-        mock_params.return_value.carehome_params\
-            = {'carehome_resident_household_scaling': 2}
+        mock_params.return_value._carehome_household_scale = (1.0, 2)
         mock_params.return_value.household_transmission = 1
         mock_params.return_value.false_positive_rate = 0
         self.infector.care_home_resident = True
@@ -1,3 +1,5 @@
+import math
+import numpy as np
 import unittest
 from unittest.mock import patch
 
@@ -29,11 +31,10 @@ class TestPlaceInfection(TestPyEpiabm):
         cls.place.add_person(cls.infectee)
         cls.time = 1.0
 
-    def test_place_susc(self):
-        result = PlaceInfection.place_susc(self.place, self.infector,
-                                           self.infectee, self.time)
-        self.assertTrue(result > 0)
-        self.assertIsInstance(result, float)
+    def test_cached_parameters(self):
+        params = pe.Parameters.instance()
+        self.assertIs(PlaceInfection._p(), params)
+        self.assertIs(PlaceInfection._params, params)
 
     def test_place_inf(self):
         result = PlaceInfection.place_inf(self.place, self.infector, self.time)
@@ -53,8 +54,26 @@ class TestPlaceInfection(TestPyEpiabm):
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
+        # Infectiousness may be precomputed by place_inf
+        infectiousness = PlaceInfection.place_inf(self.place, self.infector,
+                                                  self.time)
+        with patch('pyEpiabm.property.PlaceInfection.place_inf') as mock_inf:
+            result_precomputed = PlaceInfection.place_foi(
+                self.place, self.infector, self.infectee, self.time,
+                precomputed_inf=infectiousness)
+            mock_inf.assert_not_called()
+        self.assertEqual(result, result_precomputed)
+
+        # Closed places have no infectiousness
+        self.infector.place_types.append(PlaceType.PrimarySchool)
+        self.microcell.closure_start_time = 1
+        self.assertEqual(PlaceInfection.place_foi(
+            self.place, self.infector, self.infectee, self.time), 0)
+        self.microcell.closure_start_time = math.inf
+        self.infector.place_types.remove(PlaceType.PrimarySchool)
+
     def test_place_case_isolation(self):
-        # Not isolating (isolation_start_time = None)
+        # Not isolating (isolation_start_time = inf)
         result = PlaceInfection.place_foi(self.place, self.infector,
                                           self.infectee, self.time)
 
@@ -68,7 +87,7 @@ class TestPlaceInfection(TestPyEpiabm):
                          result_isolating)
 
     def test_place_place_closure(self):
-        # Update place type, not place closure (closure_start_time = None)
+        # Update place type, not place closure (closure_start_time = inf)
         self.infector.place_types.append(PlaceType.PrimarySchool)
         result = PlaceInfection.place_inf(self.place, self.infector, self.time)
         self.assertNotEqual(result, 0)
@@ -80,7 +99,7 @@ class TestPlaceInfection(TestPyEpiabm):
         self.assertEqual(result_closure, 0)
 
     def test_place_household_quarantine(self):
-        # Update place type, not in quarantine (quarantine_start_time = None)
+        # Update place type, not in quarantine (quarantine_start_time = inf)
         result = PlaceInfection.place_foi(self.place, self.infector,
                                           self.infectee, self.time)
 
@@ -98,9 +117,9 @@ class TestPlaceInfection(TestPyEpiabm):
                          result_isolating)
 
     def test_place_social_distancing(self):
-        # Not in social distancing (distancing_start_time = None)
-        result = PlaceInfection.place_susc(self.place, self.infector,
-                                           self.infectee, self.time)
+        # Not in social distancing (distancing_start_time = inf)
+        result = PlaceInfection.place_foi(self.place, self.infector,
+                                          self.infectee, self.time)
         place_idx = self.place.place_type.value - 1
 
         # Normal social distancing
@@ -109,28 +128,31 @@ class TestPlaceInfection(TestPyEpiabm):
         distancing_place_susc = pe.Parameters.instance().\
             intervention_params['social_distancing'][
                 'distancing_place_susc']
-        result_distancing = PlaceInfection.place_susc(
+        result_distancing = PlaceInfection.place_foi(
             self.place, self.infector, self.infectee, self.time)
-        self.assertEqual(result*distancing_place_susc[place_idx],
-                         result_distancing)
+        self.assertAlmostEqual(result*distancing_place_susc[place_idx],
+                               result_distancing)
         # Enhanced social distancing
         self.infector.distancing_enhanced = True
         distancing_place_enhanced_susc = pe.Parameters.instance().\
             intervention_params['social_distancing'][
                 'distancing_place_enhanced_susc']
-        result_distancing_enhanced = PlaceInfection.place_susc(
+        result_distancing_enhanced = PlaceInfection.place_foi(
             self.place, self.infector, self.infectee, self.time)
-        self.assertEqual(result*distancing_place_enhanced_susc[place_idx],
-                         result_distancing_enhanced)
+        self.assertAlmostEqual(
+            result*distancing_place_enhanced_susc[place_idx],
+            result_distancing_enhanced)
 
-    @patch('pyEpiabm.property.PlaceInfection.place_susc')
-    @patch('pyEpiabm.property.PlaceInfection.place_inf')
-    @patch('pyEpiabm.core.Parameters.instance')
-    def test_carehome_scaling(self, mock_params, mock_inf, mock_susc):
+    @patch('pyEpiabm.property.PersonalInfection.person_inf')
+    @patch('pyEpiabm.property.PlaceInfection._p')
+    def test_carehome_scaling(self, mock_params, mock_inf):
         mock_inf.return_value = 1
-        mock_susc.return_value = 1
-        mock_params.return_value.carehome_params\
-            = {'carehome_worker_group_scaling': 2}
+        worker_scale = np.ones(len(PlaceType))
+        worker_scale[PlaceType.CareHome.value - 1] = 2
+        mock_params.return_value._carehome_worker_scale = worker_scale
+        mock_params.return_value.place_params\
+            = {'place_transmission': 1,
+               'mean_group_size': [1] * len(PlaceType)}
         self.place.place_type = pe.property.PlaceType.CareHome
         self.infector.key_worker = True
         self.infectee.key_worker = False
@@ -139,7 +161,12 @@ class TestPlaceInfection(TestPyEpiabm):
         self.assertEqual(result, 2)
 
         self.assertEqual(mock_inf.call_count, 1)
-        self.assertEqual(mock_susc.call_count, 1)
+        self.place.place_type = pe.property.PlaceType.Workplace
+
+        # Key workers only change the force of infection in care homes
+        result = PlaceInfection.place_foi(self.place, self.infector,
+                                          self.infectee, self.time)
+        self.assertEqual(result, 1)
 
 
 if __name__ == '__main__':
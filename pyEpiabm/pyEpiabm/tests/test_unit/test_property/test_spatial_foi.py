@@ -76,7 +76,7 @@ class TestSpatialInfection(TestPyEpiabm):
         self.assertTrue(result >= 0)
 
     def test_spatial_case_isolation(self):
-        # Not isolating (isolation_start_time = None)
+        # Not isolating (isolation_start_time = inf)
         result = SpatialInfection.spatial_foi(
             self.cell, self.cell,
             self.infector, self.infectee, self.time)
@@ -93,7 +93,7 @@ class TestSpatialInfection(TestPyEpiabm):
                          result_isolating)
 
     def test_spatial_place_closure(self):
-        # Update place type, not place closure (closure_start_time = None)
+        # Update place type, not place closure (closure_start_time = inf)
         self.infector.place_types.append(PlaceType.PrimarySchool)
         result_susc = SpatialInfection.spatial_susc(
             self.cell, self.infector, self.infectee, self.time)
@@ -119,7 +119,7 @@ class TestSpatialInfection(TestPyEpiabm):
                          result_closure_inf)
 
     def test_spatial_household_quarantine(self):
-        # Not in quarantine (quarantine_start_time = None)
+        # Not in quarantine (quarantine_start_time = inf)
         result = SpatialInfection.spatial_foi(
             self.cell, self.cell,
             self.infector, self.infectee, self.time)
@@ -137,7 +137,7 @@ class TestSpatialInfection(TestPyEpiabm):
                          result_isolating)
 
     def test_spatial_social_distancing(self):
-        # Not in social distancing (distancing_start_time = None)
+        # Not in social distancing (distancing_start_time = inf)
         result = SpatialInfection.spatial_susc(
             self.cell, self.infector, self.infectee, self.time)
 
@@ -12,12 +12,28 @@ class TestPopConfig(TestPyEpiabm):
     """Test the 'ToyPopConfig' class.
     """
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        super(TestPopConfig, cls).setUpClass()  # Sets up parameters
+        cls.input = {'cell': [1.0, 2.0], 'microcell': [1.0, 1.0],
+                     'location_x': [0.0, 1.0], 'location_y': [0.0, 1.0],
+                     'household_number': [1, 1], 'place_number': [1, 1],
+                     'Susceptible': [8, 9], 'InfectMild': [2, 3]}
+        # Tests which modify the input should use a copy of this
+        cls._template_df = pd.DataFrame(cls.input)
+        cls._pop = None
+
+    @classmethod
+    def _build_pop(cls):
+        """Returns a population made from the template input, which is
+        only built once. Tests must not modify this population.
+        """
+        if cls._pop is None:
+            with patch("pandas.read_csv", return_value=cls._template_df):
+                cls._pop = FilePopulationFactory.make_pop('test_input.csv')
+        return cls._pop
+
     def setUp(self) -> None:
-        self.input = {'cell': [1.0, 2.0], 'microcell': [1.0, 1.0],
-                      'location_x': [0.0, 1.0], 'location_y': [0.0, 1.0],
-                      'household_number': [1, 1], 'place_number': [1, 1],
-                      'Susceptible': [8, 9], 'InfectMild': [2, 3]}
-        self.df = pd.DataFrame(self.input)
         pe.Parameters.instance().household_size_distribution = []
 
     @patch('logging.exception')
@@ -34,7 +50,7 @@ class TestPopConfig(TestPyEpiabm):
         """Tests for when the population is read in from file.
         """
         # Population is initialised with no households
-        mock_read.return_value = self.df
+        mock_read.return_value = self._template_df
 
         test_pop = FilePopulationFactory.make_pop('test_input.csv')
         mock_read.assert_called_once_with('test_input.csv')
@@ -88,7 +104,8 @@ class TestPopConfig(TestPyEpiabm):
         """Test error handling for unknown column name
         """
         # Read in data with incorrect infection status
-        data = self.df.rename(columns={'InfectMild': 'InfectUnknown'})
+        data = self._template_df.rename(
+            columns={'InfectMild': 'InfectUnknown'})
         mock_read.return_value = data
 
         FilePopulationFactory.make_pop('test_input.csv')
@@ -102,7 +119,7 @@ class TestPopConfig(TestPyEpiabm):
         """Test error handling for duplicate microcell
         """
         # Move second microcell to first cell (with duplicate id)
-
+        self.df = self._template_df.copy()
         self.df.iat[1, 0] = 1
 
         mock_read.return_value = self.df
@@ -131,6 +148,7 @@ class TestPopConfig(TestPyEpiabm):
         """Tests when households are implemented.
         """
         # Define multiple households in cells
+        self.df = self._template_df.copy()
         self.df['household_number'] = pd.Series([2, 3])
         mock_read.return_value = self.df
 
@@ -158,7 +176,7 @@ class TestPopConfig(TestPyEpiabm):
     def test_random_seed_param(self, mock_read, mock_random,
                                mock_np_random, n=42):
         # Population is initialised with no households
-        mock_read.return_value = self.df
+        mock_read.return_value = self._template_df
 
         FilePopulationFactory.make_pop('test_input.csv', random_seed=n)
         mock_read.assert_called_once_with('test_input.csv')
@@ -166,15 +184,12 @@ class TestPopConfig(TestPyEpiabm):
         mock_random.assert_called_once_with(n)
         mock_np_random.assert_called_once_with(n)
 
-    @patch("pandas.read_csv")
     @patch("pandas.DataFrame.to_csv")
-    def test_print_population_loc(self, mock_write, mock_read):
+    def test_print_population_loc(self, mock_write):
         """Tests method to print population to csv, to ensure that
         the file outputs to the correct location.
         """
-        mock_read.return_value = self.df
-
-        test_pop = FilePopulationFactory.make_pop('test_input.csv')
+        test_pop = self._build_pop()
         self.assertEqual(len(test_pop.cells), 2)
         self.assertEqual(test_pop.total_people(), 22)
 
@@ -188,6 +203,7 @@ class TestPopConfig(TestPyEpiabm):
         """Tests method to print population to csv, to match content
         with target. Uses meaningful household data.
         """
+        self.df = self._template_df.copy()
         self.df['household_number'] = pd.Series([2, 3])
         mock_read.return_value = self.df
 
@@ -213,14 +229,12 @@ class TestPopConfig(TestPyEpiabm):
 
     @patch('logging.exception')
     @patch("pandas.DataFrame.to_csv")
-    @patch("pandas.read_csv")
-    def test_print_pop_exception(self, mock_read, mock_print, mock_log):
+    def test_print_pop_exception(self, mock_print, mock_log):
         """Tests for when the population is read from empty file.
         """
         mock_print.side_effect = FileNotFoundError
-        mock_read.return_value = self.df
 
-        test_pop = FilePopulationFactory.make_pop('test_input.csv')
+        test_pop = self._build_pop()
 
         FilePopulationFactory.print_population(test_pop, 'output.csv')
 
@@ -246,7 +260,7 @@ class TestPopConfig(TestPyEpiabm):
     def test_use_of_household_size_distribution(self, mock_household_function,
                                                 mock_read):
         pe.Parameters.instance().household_size_distribution = [0.5, 0.5]
-        mock_read.return_value = self.df
+        mock_read.return_value = self._template_df
 
         FilePopulationFactory.make_pop('test_input.csv')
         mock_household_function.assert_called_once()
@@ -37,12 +37,14 @@ class TestHouseholdSweep(TestPyEpiabm):
                          .persons[0].infection_status,
                          pe.property.InfectionStatus.InfectMild)
 
+    @mock.patch('pyEpiabm.property.HouseholdInfection.household_foi_inf')
     @mock.patch('pyEpiabm.property.HouseholdInfection.household_foi')
-    def test__call__(self, mock_force):
+    def test__call__(self, mock_force, mock_inf):
         """Test whether the household sweep function correctly
         adds persons to the queue.
         """
         mock_force.return_value = 100.0
+        mock_inf.return_value = 1.0
 
         # Assert a population with one infected will not change the queue
         self.test_sweep = pe.sweep.HouseholdSweep()
@@ -70,6 +72,10 @@ class TestHouseholdSweep(TestPyEpiabm):
         self.test_sweep.bind_population(self.pop)
         self.test_sweep(self.time)
         self.assertEqual(self.cell.person_queue.qsize(), 1)
+        # Infector's contribution is computed once and reused
+        mock_inf.assert_called_once_with(self.person, self.time)
+        mock_force.assert_called_once_with(self.person, new_person,
+                                           self.time, precomputed_inf=1.0)
 
         # Change the additional person to recovered, and assert the queue
         # is empty.
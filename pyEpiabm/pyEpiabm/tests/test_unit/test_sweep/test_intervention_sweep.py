@@ -1,3 +1,4 @@
+import math
 import unittest
 
 import pyEpiabm as pe
@@ -66,10 +67,10 @@ class TestInterventionSweep(TestPyEpiabm):
                  if isinstance(key, SocialDistancing)][0]])
 
         # Place is closed and social distancing ends
-        self.assertIsNotNone(self.interventionsweep._population.cells[0].
-                             microcells[0].closure_start_time)
-        self.assertIsNotNone(self.interventionsweep._population.cells[0].
-                             microcells[0].distancing_start_time)
+        self.assertNotEqual(self.interventionsweep._population.cells[0].
+                            microcells[0].closure_start_time, math.inf)
+        self.assertNotEqual(self.interventionsweep._population.cells[0].
+                            microcells[0].distancing_start_time, math.inf)
 
         # Infector in case isolation, infectee in quarantine as
         # isolation_start_time = 100 as evaluated at this time (see above)
@@ -80,7 +81,7 @@ class TestInterventionSweep(TestPyEpiabm):
         self.interventionsweep.intervention_params['household_quarantine'][
             'quarantine_individual_compliant'] = 1.0
         self.assertEqual(self.person_symp.isolation_start_time, 10)
-        self.assertIsNotNone(self.person_susc.quarantine_start_time)
+        self.assertNotEqual(self.person_susc.quarantine_start_time, math.inf)
 
         # Stop isolating after start_time + policy_duration
         self.interventionsweep.intervention_params['case_isolation'][
@@ -94,7 +95,7 @@ class TestInterventionSweep(TestPyEpiabm):
                 [key for key in
                  self.interventionsweep.intervention_active_status.keys()
                  if isinstance(key, CaseIsolation)][0]])
-        self.assertIsNone(self.person_symp.isolation_start_time)
+        self.assertEqual(self.person_symp.isolation_start_time, math.inf)
 
 
 if __name__ == '__main__':